@@ -10,14 +10,37 @@ import sys
 import os
 import ssl
 import socket
+import asyncio
 import json
-import re
+import struct
 import time
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
 from urllib.parse import urlparse
 import logging
 
+try:
+    from cryptography import x509
+except ImportError:
+    # Fall back to the legacy getpeercert() dict path if cryptography is missing
+    x509 = None
+
+# The CPU-bound date-parsing helpers live in ssl_monitor_core so they can be
+# compiled with mypyc/Cython; the plain-Python module works as-is
+from ssl_monitor_core import build_expiry_info, parse_notafter_string
+
+# Emoji per certificate status, shared by all Slack message builders
+_STATUS_EMOJI = {
+    'valid': '✅',
+    'expiring_soon': '⚠️',
+    'expired': '🚨',
+    'error': '❌'
+}
+
 # Add dimple_utils to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'dimple_utils', 'dimple_utils'))
 
@@ -27,11 +50,13 @@ from config_utils import load_properties
 
 class SSLCertificateMonitor:
     """SSL Certificate monitoring class"""
-    
+
+    # Shared SSLContext, built lazily - see _get_ssl_context()
+    _shared_ssl_context = None
+
+
     def __init__(self, config_path="configs/sites.json", properties_path="configs/default.properties"):
         """Initialize the SSL monitor with configuration"""
-        self.url_list = self.load_config(config_path)
-        
         # Load properties configuration
         self.config = load_properties(properties_path)
         
@@ -52,16 +77,67 @@ class SSLCertificateMonitor:
         
         setup_logging(log_directory, log_level_constant, log_file)
         self.logger = logging.getLogger()
-        
+
+        # Load the site list after logging is up so config problems are logged,
+        # and fail fast here on bad entries instead of once per monitoring run
+        self.url_list = self.load_config(config_path)
+
+        # Filter the enabled sites once - the config only changes on restart
+        self._enabled_sites = tuple(site for site in self.url_list.get('sites', [])
+                                    if site.get('enabled', True))
+
+
         self.warning_days = int(self.config.get('monitoring.warning_days', 7))
         self.timeout = int(self.config.get('monitoring.timeout_seconds', 10))
+
+        # Address family for site checks: 'auto' keeps the OS default (IPv6
+        # attempted first where available); 'inet' or 'inet6' pins resolution
+        # to one family, which avoids paying an IPv6 connect timeout per host
+        # on networks without working v6
+        family_name = self.config.get('monitoring.address_family', 'auto').lower()
+        self.address_family = {
+            'inet': socket.AF_INET,
+            'inet6': socket.AF_INET6
+        }.get(family_name, socket.AF_UNSPEC)
+        self.max_workers = int(self.config.get('monitoring.max_workers', 32))
+
+        # Concurrency mode for the per-site checks: 'threads' (default) uses a
+        # bounded thread pool; 'asyncio' runs all handshakes on one event loop,
+        # which scales to thousands of hosts without per-thread stack cost
+        self.concurrency_mode = self.config.get('monitoring.concurrency', 'threads').lower()
+        self.async_limit = int(self.config.get('monitoring.async_limit', 256))
+        self._prefetched_certs = {}
+
+        # Persistent certificate cache - skips re-fetching certs on frequent runs
+        self.cache_path = self.config.get('monitoring.cache_path', '.ssl_cache.json')
+        self.cache_ttl = int(self.config.get('monitoring.cache_ttl_seconds', 3600))
+        self._cert_cache = {}
+
+        # DNS pre-resolution cache - hostname -> IP for the current run
+        self.dns_ttl = int(self.config.get('monitoring.dns_ttl_seconds', 300))
+        self._dns_cache = {}
+
+        # Single reference time per run - certificate notAfter fields are UTC,
+        # and day-level tolerances don't need a fresh clock read per parse
+        self._run_started_at = datetime.now(timezone.utc)
         
         # Slack configuration
         self.slack_enabled = self.config.get('SLACK_ENABLED', 'false').lower() == 'true'
         self.slack_webhook_url = self.config.get('SLACK_WEBHOOK_URL')
         self.send_weekly_report = self.config.get('SLACK_SEND_WEEKLY_REPORT_ON_SUNDAY', 'false').lower() == 'true'
         self.slack_status_notify_user_id = self.config.get('SLACK_STATUS_NOTIFY_USER_ID')
-        
+
+        # Reuse one HTTP session for Slack posts so keep-alive amortizes the
+        # TCP+TLS handshake across alerts, with a small jittered retry budget
+        self._http = requests.Session()
+        self._http.headers.update({'Content-type': 'application/json'})
+        self._http.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        ))
+
+
         # Log Slack configuration
         self.logger.info(f"Slack configuration loaded:")
         self.logger.info(f"  - Slack enabled: {self.slack_enabled}")
@@ -75,7 +151,25 @@ class SSLCertificateMonitor:
         """Load configuration from JSON file"""
         try:
             with open(config_path, 'r') as f:
-                return json.load(f)
+                config = json.load(f)
+
+            # Parse each site URL once at load time - urlparse is not free and
+            # the hostnames don't change between monitoring runs
+            for site in config.get('sites', []):
+                parsed_url = urlparse(site.get('url', ''))
+                site['_hostname'] = parsed_url.hostname
+                site['_port'] = parsed_url.port or 443
+
+            # Fail fast on unusable URLs at startup rather than erroring on
+            # every monitoring run
+            bad_sites = [f"{site.get('name', '<unnamed>')} ({site.get('url', '<no url>')})"
+                         for site in config.get('sites', [])
+                         if site.get('enabled', True) and not site['_hostname']]
+            if bad_sites:
+                self.logger.error(f"Invalid site URLs in {config_path}: {', '.join(bad_sites)}")
+                raise ValueError(f"Invalid site URLs in {config_path}: {', '.join(bad_sites)}")
+
+            return config
         except FileNotFoundError:
             self.logger.error(f"Configuration file not found: {config_path}")
             raise
@@ -83,28 +177,214 @@ class SSLCertificateMonitor:
             self.logger.error(f"Invalid JSON in configuration file: {e}")
             raise
         
-    def get_ssl_certificate_info(self, hostname, port=443):
-        """Get SSL certificate information for a hostname"""
-        self.logger.debug(f"Attempting SSL connection to {hostname}:{port}")
-        
+    def _load_certificate_cache(self):
+        """Load the persistent certificate cache, falling back to empty on errors"""
         try:
-            # Create SSL context
+            with open(self.cache_path, 'r') as f:
+                cache = json.load(f)
+            if isinstance(cache, dict):
+                return cache
+            self.logger.warning(f"Ignoring malformed certificate cache: {self.cache_path}")
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, OSError) as e:
+            self.logger.warning(f"Could not load certificate cache {self.cache_path}: {e}")
+        return {}
+
+    def _save_certificate_cache(self):
+        """Persist the certificate cache for the next run"""
+        try:
+            with open(self.cache_path, 'w') as f:
+                json.dump(self._cert_cache, f, indent=2)
+        except OSError as e:
+            self.logger.warning(f"Could not save certificate cache {self.cache_path}: {e}")
+
+    def _get_cached_expiry_info(self, hostname, port=443):
+        """Return cached expiry info for a host, or None if a live fetch is needed"""
+        entry = self._cert_cache.get(f"{hostname}:{port}")
+        if not entry:
+            return None
+
+        try:
+            fetched_at = float(entry['fetched_at'])
+            expiry_date = datetime.fromisoformat(entry['expiry_date'])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        if fetched_at + self.cache_ttl <= time.time():
+            return None
+
+        # Entries written by older versions may be naive - notAfter is UTC
+        if expiry_date.tzinfo is None:
+            expiry_date = expiry_date.replace(tzinfo=timezone.utc)
+
+        expiry_info = build_expiry_info(expiry_date, self._run_started_at, self.warning_days)
+
+        # Always re-fetch once the expiry is near the warning threshold so that
+        # renewals and state changes are observed live, never from the cache
+        if expiry_info['days_until_expiry'] <= self.warning_days + 1:
+            return None
+
+        self.logger.debug(f"Using cached certificate expiry for {hostname}:{port}")
+
+        return expiry_info
+
+    def _prefetch_dns(self, hostnames):
+        """Resolve all hostnames up front so the check sockets skip DNS lookups
+
+        Resolutions fan out over a thread pool and are persisted in the cache
+        file under the reserved '_dns' key with a short TTL. Hosts that fail to
+        resolve are simply left out - the check socket then falls back to its
+        own lookup and reports the error through the normal path.
+        """
+        now = time.time()
+        persisted = self._cert_cache.get('_dns', {})
+        if not isinstance(persisted, dict):
+            persisted = {}
+
+        unresolved = []
+        for hostname in hostnames:
+            entry = persisted.get(hostname)
+            if isinstance(entry, dict) and entry.get('ip') and entry.get('resolved_at', 0) + self.dns_ttl > now:
+                self._dns_cache[hostname] = entry['ip']
+            else:
+                unresolved.append(hostname)
+
+        if unresolved:
+            self.logger.debug(f"Pre-resolving DNS for {len(unresolved)} hosts")
+            with ThreadPoolExecutor(max_workers=min(64, len(unresolved))) as executor:
+                futures = {
+                    executor.submit(socket.getaddrinfo, hostname, 443,
+                                    self.address_family, socket.SOCK_STREAM): hostname
+                    for hostname in unresolved
+                }
+                for future in as_completed(futures):
+                    hostname = futures[future]
+                    try:
+                        ip = future.result()[0][4][0]
+                    except (OSError, IndexError) as e:
+                        self.logger.debug(f"DNS pre-resolution failed for {hostname}: {e}")
+                        continue
+                    self._dns_cache[hostname] = ip
+                    persisted[hostname] = {'ip': ip, 'resolved_at': now}
+
+        self._cert_cache['_dns'] = persisted
+
+    def _store_cached_expiry(self, hostname, expiry_date, port=443):
+        """Record a freshly fetched certificate expiry in the cache"""
+        self._cert_cache[f"{hostname}:{port}"] = {
+            'fetched_at': time.time(),
+            'expiry_date': expiry_date.isoformat()
+        }
+
+    @classmethod
+    def _get_ssl_context(cls):
+        """Return the shared SSLContext, creating it on first use
+
+        Building a context loads the system CA store and cipher lists, which is
+        the expensive part; all sites share the same settings, so one context is
+        enough. SSLContext is safe for concurrent wrap_socket() calls from the
+        worker threads.
+        """
+        if cls._shared_ssl_context is None:
             context = ssl.create_default_context()
             context.check_hostname = False
-            context.verify_mode = ssl.CERT_REQUIRED  # Changed to get certificate data
-            
-            self.logger.debug(f"Created SSL context for {hostname}")
-            
-            # Connect to the host
-            self.logger.debug(f"Creating socket connection to {hostname}:{port}")
-            with socket.create_connection((hostname, port), timeout=self.timeout) as sock:
-                self.logger.debug(f"Socket connected to {hostname}:{port}")
-                
+            if x509 is not None:
+                # We only need the expiry dates, not trust verification, so skip
+                # chain validation and grab the raw DER certificate instead of the
+                # much slower verified getpeercert() dict
+                context.verify_mode = ssl.CERT_NONE
+            else:
+                context.verify_mode = ssl.CERT_REQUIRED  # Needed to get the cert dict
+            cls._shared_ssl_context = context
+        return cls._shared_ssl_context
+
+    async def _fetch_cert_async(self, hostname, port, semaphore):
+        """Fetch one peer certificate over an asyncio TLS connection"""
+        async with semaphore:
+            connect_host = self._dns_cache.get(hostname, hostname)
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(connect_host, port,
+                                        ssl=self._get_ssl_context(),
+                                        server_hostname=hostname,
+                                        family=self.address_family),
+                timeout=self.timeout
+            )
+            try:
+                ssl_object = writer.get_extra_info('ssl_object')
+                if x509 is not None:
+                    return ssl_object.getpeercert(binary_form=True)
+                return ssl_object.getpeercert()
+            finally:
+                writer.close()
+
+    async def _prefetch_certs_async(self, hostnames, port=443):
+        """Fetch all peer certificates concurrently on one event loop
+
+        Uses a semaphore instead of a thread pool, so thousands of in-flight
+        handshakes cost event-loop bookkeeping rather than one OS thread and
+        stack each. Returns hostname -> cert-info dict in the same shape as
+        get_ssl_certificate_info.
+        """
+        semaphore = asyncio.Semaphore(self.async_limit)
+
+        async def fetch(hostname):
+            try:
+                cert = await self._fetch_cert_async(hostname, port, semaphore)
+                return hostname, {'success': True, 'cert': cert, 'error': None}
+            except Exception as e:
+                error = str(e) or type(e).__name__
+                self.logger.error(f"SSL connection failed for {hostname}: {error}")
+                return hostname, {'success': False, 'cert': None, 'error': error}
+
+        results = await asyncio.gather(*(fetch(hostname) for hostname in hostnames))
+        return dict(results)
+
+    def get_ssl_certificate_info(self, hostname, port=443):
+        """Get SSL certificate information for a hostname"""
+        # Serve from the asyncio prefetch when one ran for this host
+        prefetched = self._prefetched_certs.get(hostname)
+        if prefetched is not None:
+            return prefetched
+
+        # Debug lines here use %-style deferred formatting so the strings are
+        # only rendered when DEBUG logging is actually enabled
+        self.logger.debug("Attempting SSL connection to %s:%s", hostname, port)
+
+        try:
+            # Reuse the shared SSL context rather than rebuilding one per site
+            context = self._get_ssl_context()
+
+            # Connect to the host, using the pre-resolved IP when we have one.
+            # SNI still uses the hostname via server_hostname below.
+            connect_host = self._dns_cache.get(hostname)
+            if connect_host is None and self.address_family != socket.AF_UNSPEC:
+                # Resolve within the pinned family so create_connection never
+                # tries addresses the network can't reach
+                addrinfo = socket.getaddrinfo(hostname, port, self.address_family, socket.SOCK_STREAM)
+                connect_host = addrinfo[0][4][0]
+            if connect_host is None:
+                connect_host = hostname
+
+            self.logger.debug("Creating socket connection to %s:%s", hostname, port)
+            with socket.create_connection((connect_host, port), timeout=self.timeout) as sock:
+                self.logger.debug("Socket connected to %s:%s", hostname, port)
+
+                # Send handshake records immediately and reset on close instead
+                # of a graceful FIN shutdown - we abandon the connection as soon
+                # as the certificate is in hand, so there is no point paying the
+                # extra round trip per site to tear it down politely
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+
                 with context.wrap_socket(sock, server_hostname=hostname) as ssock:
-                    self.logger.debug(f"SSL socket wrapped for {hostname}")
-                    cert = ssock.getpeercert()
-                    self.logger.debug(f"Retrieved certificate for {hostname}: {cert}")
-                    
+                    self.logger.debug("SSL socket wrapped for %s", hostname)
+                    if x509 is not None:
+                        cert = ssock.getpeercert(binary_form=True)
+                    else:
+                        cert = ssock.getpeercert()
+                    self.logger.debug("Retrieved certificate for %s: %r", hostname, cert)
+
             return {
                 'success': True,
                 'cert': cert,
@@ -123,77 +403,40 @@ class SSLCertificateMonitor:
         if not cert:
             self.logger.error("Certificate data is None or empty")
             return None
-        
-        # Debug: Log the entire certificate structure
-        self.logger.debug(f"Certificate data: {cert}")
-        
-        # Parse the notAfter date
-        not_after_str = cert.get('notAfter')
-        if not_after_str:
-            self.logger.debug(f"Certificate notAfter string: '{not_after_str}'")
-            
-            # Try multiple date formats
-            date_formats = [
-                '%b %d %H:%M:%S %Y %Z',  # Dec 31 23:59:59 2023 GMT
-                '%b %d %H:%M:%S %Y',     # Dec 31 23:59:59 2023
-                '%Y-%m-%d %H:%M:%S',     # 2023-12-31 23:59:59
-                '%Y-%m-%d',              # 2023-12-31
-                '%d/%m/%Y',              # 31/12/2023
-                '%m/%d/%Y',              # 12/31/2023
-            ]
-            
-            for date_format in date_formats:
-                try:
-                    not_after = datetime.strptime(not_after_str, date_format)
-                    now = datetime.now()
-                    days_until_expiry = (not_after - now).days
-                    
-                    self.logger.debug(f"Successfully parsed date with format '{date_format}': {not_after}")
-                    
-                    return {
-                        'expiry_date': not_after,
-                        'days_until_expiry': days_until_expiry,
-                        'is_expired': days_until_expiry < 0,
-                        'is_expiring_soon': days_until_expiry <= self.warning_days
-                    }
-                except ValueError:
-                    continue
-            
-            # If none of the formats worked, log the actual string and try a more flexible approach
-            self.logger.error(f"Could not parse certificate date with any known format: '{not_after_str}'")
-            
-            # Try to extract just the year, month, day if it's in a different format
+
+        # Debug: Log the entire certificate structure - deferred formatting so
+        # the multi-KB repr is only built when DEBUG is enabled
+        self.logger.debug("Certificate data: %r", cert)
+
+        # Fast path: DER bytes parsed with cryptography - no string date parsing
+        # needed, and both UTCTime and GeneralizedTime encodings are handled
+        if isinstance(cert, bytes):
             try:
-                # Look for patterns like "Dec 31 2023" or "31 Dec 2023"
-                date_match = re.search(r'(\w{3})\s+(\d{1,2})\s+(\d{4})', not_after_str)
-                if date_match:
-                    month_str, day_str, year_str = date_match.groups()
-                    month_map = {
-                        'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
-                        'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-                    }
-                    if month_str in month_map:
-                        not_after = datetime(int(year_str), month_map[month_str], int(day_str))
-                        now = datetime.now()
-                        days_until_expiry = (not_after - now).days
-                        
-                        return {
-                            'expiry_date': not_after,
-                            'days_until_expiry': days_until_expiry,
-                            'is_expired': days_until_expiry < 0,
-                            'is_expiring_soon': days_until_expiry <= self.warning_days
-                        }
+                parsed_cert = x509.load_der_x509_certificate(cert)
+                not_after = parsed_cert.not_valid_after_utc
             except Exception as e:
-                self.logger.error(f"Error in flexible date parsing: {e}")
-            
-            return None
-        else:
+                self.logger.error(f"Could not parse DER certificate: {e}")
+                return None
+
+            return build_expiry_info(not_after, self._run_started_at, self.warning_days)
+
+        # Legacy path: getpeercert() dict with a pre-rendered notAfter string
+        not_after_str = cert.get('notAfter')
+        if not not_after_str:
             self.logger.error("Certificate does not contain 'notAfter' field")
             # Log all available fields in the certificate
-            self.logger.debug(f"Available certificate fields: {list(cert.keys())}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Available certificate fields: %s", list(cert.keys()))
             return None
-        
-        return None
+
+        self.logger.debug("Certificate notAfter string: '%s'", not_after_str)
+
+        not_after = parse_notafter_string(not_after_str)
+        if not_after is None:
+            self.logger.error(f"Could not parse certificate date with any known format: '{not_after_str}'")
+            return None
+
+        return build_expiry_info(not_after, self._run_started_at, self.warning_days)
     
     def send_slack_message(self, message: str, user_id: str = None) -> bool:
         """
@@ -221,10 +464,9 @@ class SSLCertificateMonitor:
             
             self.logger.info(f"Sending Slack message with payload: {json.dumps(payload, indent=2)}")
             
-            response = requests.post(
+            response = self._http.post(
                 self.slack_webhook_url,
                 json=payload,
-                headers={'Content-type': 'application/json'},
                 timeout=10
             )
             
@@ -254,29 +496,48 @@ class SSLCertificateMonitor:
         :return: True if successful, False otherwise
         """
         # Determine emoji based on status
-        status_config = {
-            'valid': '✅',
-            'expiring_soon': '⚠️',
-            'expired': '🚨',
-            'error': '❌'
-        }
-        
-        emoji = status_config.get(status, 'ℹ️')
-        
+        emoji = _STATUS_EMOJI.get(status, 'ℹ️')
+
         # Build the message
-        alert_message = f"{emoji} SSL Certificate Alert for {site_name}\n"
-        alert_message += f"URL: {site_url}\n"
-        alert_message += f"Status: {message}\n"
-        
+        parts = [
+            f"{emoji} SSL Certificate Alert for {site_name}",
+            f"URL: {site_url}",
+            f"Status: {message}",
+        ]
+
         if expiry_date:
-            alert_message += f"Expiry Date: {expiry_date}\n"
-        
+            parts.append(f"Expiry Date: {expiry_date}")
+
         if days_until_expiry is not None:
-            alert_message += f"Days Until Expiry: {days_until_expiry}"
-        
+            parts.append(f"Days Until Expiry: {days_until_expiry}")
+
         # Send message with user mention if configured
-        return self.send_slack_message(alert_message, self.slack_status_notify_user_id)
+        return self.send_slack_message('\n'.join(parts), self.slack_status_notify_user_id)
     
+    def send_batched_ssl_alerts(self, alerts: list) -> bool:
+        """
+        Send one aggregated Slack alert covering all problematic sites
+
+        :param alerts: List of site results with status expired/expiring_soon/error
+        :return: True if successful, False otherwise
+        """
+        if not alerts:
+            return False
+
+        parts = [f"🚨 SSL Certificate Alerts - {len(alerts)} site(s) need attention"]
+
+        for result in alerts:
+            emoji = _STATUS_EMOJI.get(result['status'], 'ℹ️')
+            site_line = f"{emoji} {result['site_name']} ({result['site_url']}) - {result['message']}"
+
+            if result.get('expiry_date'):
+                site_line += f" | Expires: {result['expiry_date']}"
+
+            parts.append(site_line)
+
+        # Send message with user mention if configured
+        return self.send_slack_message('\n'.join(parts), self.slack_status_notify_user_id)
+
     def send_summary_report(self, results: list) -> bool:
         """
         Send a summary report of SSL monitoring results to Slack
@@ -284,12 +545,13 @@ class SSLCertificateMonitor:
         :param results: List of monitoring results for all sites
         :return: True if successful, False otherwise
         """
-        # Calculate summary statistics
+        # Calculate summary statistics in a single pass
         total_sites = len(results)
-        valid_sites = len([r for r in results if r['status'] == 'valid'])
-        expired_sites = len([r for r in results if r['status'] == 'expired'])
-        expiring_sites = len([r for r in results if r['status'] == 'expiring_soon'])
-        error_sites = len([r for r in results if r['status'] == 'error'])
+        status_counts = Counter(r['status'] for r in results)
+        valid_sites = status_counts['valid']
+        expired_sites = status_counts['expired']
+        expiring_sites = status_counts['expiring_soon']
+        error_sites = status_counts['error']
         
         # Determine overall status and emoji
         if expired_sites > 0 or error_sites > 0:
@@ -302,31 +564,26 @@ class SSLCertificateMonitor:
             emoji = "✅"
             status = "All Good"
         
-        # Build summary message
-        summary_message = f"{emoji} SSL Monitoring Summary - {status}\n"
-        summary_message += f"Total Sites: {total_sites}\n"
-        summary_message += f"Valid: {valid_sites}\n"
-        summary_message += f"Expired: {expired_sites}\n"
-        summary_message += f"Expiring Soon: {expiring_sites}\n"
-        summary_message += f"Errors: {error_sites}\n\n"
-        
-        # Add site details
-        summary_message += "Sites Checked:\n"
+        # Build summary message as a list of lines - repeated += on a long
+        # string can degrade to quadratic copying for big site lists
+        parts = [
+            f"{emoji} SSL Monitoring Summary - {status}",
+            f"Total Sites: {total_sites}",
+            f"Valid: {valid_sites}",
+            f"Expired: {expired_sites}",
+            f"Expiring Soon: {expiring_sites}",
+            f"Errors: {error_sites}",
+            "",
+            "Sites Checked:",
+        ]
         for result in results:
             site_name = result['site_name']
             site_url = result['site_url']
             site_status = result['status']
             
             # Add appropriate emoji for each site
-            if site_status == 'valid':
-                site_emoji = "✅"
-            elif site_status == 'expiring_soon':
-                site_emoji = "⚠️"
-            elif site_status == 'expired':
-                site_emoji = "🚨"
-            else:  # error
-                site_emoji = "❌"
-            
+            site_emoji = _STATUS_EMOJI.get(site_status, '❌')
+
             # Build site line with expiry information
             site_line = f"{site_emoji} {site_name} ({site_url})"
             
@@ -350,9 +607,9 @@ class SSLCertificateMonitor:
                 else:
                     site_line += f" ({days} days remaining)"
             
-            summary_message += site_line + "\n"
-        
-        return self.send_slack_message(summary_message)
+            parts.append(site_line)
+
+        return self.send_slack_message('\n'.join(parts))
     
     def check_site_ssl(self, site_config):
         """Check SSL certificate for a single site"""
@@ -360,11 +617,12 @@ class SSLCertificateMonitor:
         site_url = site_config['url']
         
         self.logger.info(f"Checking SSL certificate for {site_name} ({site_url})")
-        
-        # Parse URL to get hostname
-        parsed_url = urlparse(site_url)
-        hostname = parsed_url.hostname
-        
+
+        # Use the hostname parsed at config load; fall back to parsing here for
+        # ad-hoc site dicts that didn't come through load_config
+        hostname = site_config.get('_hostname') or urlparse(site_url).hostname
+
+
         if not hostname:
             self.logger.error(f"Invalid URL for {site_name}: {site_url}")
             return {
@@ -375,40 +633,48 @@ class SSLCertificateMonitor:
                 'should_notify': True
             }
         
-        # Get SSL certificate info
-        cert_info = self.get_ssl_certificate_info(hostname)
-        
-        if not cert_info['success']:
-            self.logger.error(f"Failed to get SSL certificate for {site_name}: {cert_info['error']}")
-            
-            # Check if it's an expired certificate error
-            error_message = cert_info['error']
-            if 'certificate has expired' in error_message.lower():
-                enhanced_message = f"SSL connection failed: Certificate has expired (unable to retrieve expiry date due to SSL verification failure)"
-            else:
-                enhanced_message = f"SSL connection failed: {error_message}"
-            
-            return {
-                'site_name': site_name,
-                'site_url': site_url,
-                'status': 'error',
-                'message': enhanced_message,
-                'should_notify': True
-            }
-        
-        # Parse certificate dates
-        expiry_info = self.parse_certificate_dates(cert_info['cert'])
-        
-        if not expiry_info:
-            self.logger.error(f"Could not parse certificate dates for {site_name}")
-            return {
-                'site_name': site_name,
-                'site_url': site_url,
-                'status': 'error',
-                'message': 'Could not parse certificate dates',
-                'should_notify': True
-            }
-        
+        # Serve from the cache when the stored expiry is fresh and comfortably
+        # beyond the warning threshold - no network I/O needed in that case
+        expiry_info = self._get_cached_expiry_info(hostname)
+
+        if expiry_info is None:
+            # Get SSL certificate info
+            cert_info = self.get_ssl_certificate_info(hostname)
+
+            if not cert_info['success']:
+                self.logger.error(f"Failed to get SSL certificate for {site_name}: {cert_info['error']}")
+
+                # Check if it's an expired certificate error
+                error_message = cert_info['error']
+                if 'certificate has expired' in error_message.lower():
+                    enhanced_message = f"SSL connection failed: Certificate has expired (unable to retrieve expiry date due to SSL verification failure)"
+                else:
+                    enhanced_message = f"SSL connection failed: {error_message}"
+
+                return {
+                    'site_name': site_name,
+                    'site_url': site_url,
+                    'status': 'error',
+                    'message': enhanced_message,
+                    'should_notify': True
+                }
+
+            # Parse certificate dates
+            expiry_info = self.parse_certificate_dates(cert_info['cert'])
+
+            if not expiry_info:
+                self.logger.error(f"Could not parse certificate dates for {site_name}")
+                return {
+                    'site_name': site_name,
+                    'site_url': site_url,
+                    'status': 'error',
+                    'message': 'Could not parse certificate dates',
+                    'should_notify': True
+                }
+
+            self._store_cached_expiry(hostname, expiry_info['expiry_date'])
+
+
         # Determine status and notification requirements
         if expiry_info['is_expired']:
             status = 'expired'
@@ -452,67 +718,98 @@ class SSLCertificateMonitor:
         else:
             self.logger.info(f"✅ VALID: {site_name} ({site_url}) - {message}")
     
+    def _monitoring_error_result(self, site, exc):
+        """Build the error result for a site whose check itself blew up"""
+        self.logger.error(f"Error monitoring {site['name']}: {exc}")
+        return {
+            'site_name': site['name'],
+            'site_url': site['url'],
+            'status': 'error',
+            'message': f"Monitoring error: {str(exc)}",
+            'should_notify': True
+        }
+
+    def _run_checks(self, enabled_sites):
+        """Run check_site_ssl for every site using the configured concurrency mode"""
+        results = []
+
+        if self.concurrency_mode == 'asyncio':
+            # Do all handshakes concurrently on one event loop, then run the
+            # (now network-free) per-site checks sequentially
+            hostnames = {site.get('_hostname') for site in enabled_sites}
+            self._prefetched_certs = asyncio.run(
+                self._prefetch_certs_async([h for h in hostnames if h]))
+            try:
+                for site in enabled_sites:
+                    try:
+                        results.append(self.check_site_ssl(site))
+                    except Exception as e:
+                        results.append(self._monitoring_error_result(site, e))
+            finally:
+                self._prefetched_certs = {}
+            return results
+
+        # Default: the checks are pure I/O (TCP connect + TLS handshake), so run
+        # them in a bounded thread pool to keep wall-clock time close to the
+        # slowest site instead of the sum of all handshakes
+        max_workers = max(1, min(self.max_workers, len(enabled_sites) or 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.check_site_ssl, site): site for site in enabled_sites}
+
+            for future in as_completed(futures):
+                site = futures[future]
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(self._monitoring_error_result(site, e))
+
+        return results
+
     def monitor_all_sites(self):
         """Monitor all configured sites"""
-        sites = self.url_list.get('sites', [])
-        enabled_sites = [site for site in sites if site.get('enabled', True)]
-        
+        enabled_sites = self._enabled_sites
+
         self.logger.info(f"Starting SSL monitoring for {len(enabled_sites)} sites")
+
+        # Refresh the run reference time - one clock read for all date math
+        self._run_started_at = datetime.now(timezone.utc)
+
+        # Load the persistent certificate cache once per run
+        self._cert_cache = self._load_certificate_cache()
+
+        # Resolve all hostnames once before the checks start
+        hostnames = {site.get('_hostname') for site in enabled_sites}
+        self._prefetch_dns([h for h in hostnames if h])
+
+        results = self._run_checks(enabled_sites)
+
+        alerts = []
+        for result in results:
+            # Log the result
+            self.log_certificate_status(result)
+
+            # Collect critical issues for one aggregated Slack alert
+            if result['should_notify'] and result['status'] in ['expired', 'expiring_soon', 'error']:
+                alerts.append(result)
+
+        # Send a single batched Slack alert instead of one webhook call per
+        # site - avoids rate limiting when many certificates fail at once
+        if alerts and self.slack_enabled:
+            self.send_batched_ssl_alerts(alerts)
+
+        # Count issues in a single pass once all checks have completed
+        issues_found = len([r for r in results if r['should_notify']])
+
+        # Persist the updated certificate cache for the next run
+        self._save_certificate_cache()
         
-        results = []
-        issues_found = 0
-        
-        for site in enabled_sites:
-            try:
-                result = self.check_site_ssl(site)
-                results.append(result)
-                
-                # Log the result
-                self.log_certificate_status(result)
-                
-                # Count issues
-                if result['should_notify']:
-                    issues_found += 1
-                    
-                    # Send Slack notification for critical issues
-                    if self.slack_enabled and result['status'] in ['expired', 'expiring_soon', 'error']:
-                        self.send_ssl_certificate_alert(
-                            site_name=result['site_name'],
-                            site_url=result['site_url'],
-                            status=result['status'],
-                            message=result['message'],
-                            expiry_date=result.get('expiry_date'),
-                            days_until_expiry=result.get('days_until_expiry')
-                        )
-                    
-            except Exception as e:
-                self.logger.error(f"Error monitoring {site['name']}: {e}")
-                error_result = {
-                    'site_name': site['name'],
-                    'site_url': site['url'],
-                    'status': 'error',
-                    'message': f"Monitoring error: {str(e)}",
-                    'should_notify': True
-                }
-                results.append(error_result)
-                self.log_certificate_status(error_result)
-                issues_found += 1
-                
-                # Send Slack notification for errors
-                if self.slack_enabled:
-                    self.send_ssl_certificate_alert(
-                        site_name=error_result['site_name'],
-                        site_url=error_result['site_url'],
-                        status='error',
-                        message=error_result['message']
-                    )
-        
-        # Log summary
+        # Log summary - count all statuses in a single pass
         total_sites = len(enabled_sites)
-        valid_sites = len([r for r in results if r['status'] == 'valid'])
-        expired_sites = len([r for r in results if r['status'] == 'expired'])
-        expiring_sites = len([r for r in results if r['status'] == 'expiring_soon'])
-        error_sites = len([r for r in results if r['status'] == 'error'])
+        status_counts = Counter(r['status'] for r in results)
+        valid_sites = status_counts['valid']
+        expired_sites = status_counts['expired']
+        expiring_sites = status_counts['expiring_soon']
+        error_sites = status_counts['error']
         
         self.logger.info(f"Monitoring complete: {total_sites} sites checked, "
                         f"{valid_sites} valid, {expired_sites} expired, "
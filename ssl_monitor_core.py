@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Pure date-parsing helpers for the SSL certificate monitor.
+
+These functions are the CPU-bound hot path of a monitoring run and are kept
+free of I/O, logging and monitor state so the module can be compiled with
+mypyc or Cython for extra speed. The plain-Python module works unchanged when
+no compiled build is available.
+"""
+
+import re
+import ssl
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+# Flexible fallback pattern for notAfter strings like "Dec 31 2023", compiled
+# once so parse calls never depend on the re module's internal LRU cache
+_DATE_FALLBACK_RE = re.compile(r'(\w{3})\s+(\d{1,2})\s+(\d{4})')
+
+# Month-name lookup for the fast-path OpenSSL date parser
+_MONTH_MAP: Dict[str, int] = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+def fast_parse_openssl_date(date_str: str) -> datetime:
+    """Parse the standard OpenSSL notAfter format, e.g. 'Dec 31 23:59:59 2023 GMT'
+
+    Virtually every certificate uses this format, so parse it with a plain
+    split and int conversions instead of walking the strptime format list.
+    Raises KeyError/IndexError/ValueError on anything else so the caller can
+    fall back to the flexible parsers.
+    """
+    parts = date_str.split()
+    hour, minute, second = parts[2].split(':')
+    return datetime(int(parts[3]), _MONTH_MAP[parts[0]], int(parts[1]),
+                    int(hour), int(minute), int(second), tzinfo=timezone.utc)
+
+
+def parse_notafter_string(not_after_str: str) -> Optional[datetime]:
+    """Parse a certificate notAfter string into an aware UTC datetime
+
+    Tries the fast-path OpenSSL parser first, then the stdlib cert-time
+    parser, then the flexible month/day/year regex. Returns None when
+    nothing matches.
+    """
+    # Fast path: direct parse of the standard OpenSSL format, avoiding
+    # exception-driven strptime control flow for ~100% of certificates
+    try:
+        return fast_parse_openssl_date(not_after_str)
+    except (KeyError, IndexError, ValueError):
+        pass
+
+    # ssl.cert_time_to_seconds handles the cert-time grammar the stdlib
+    # itself accepts for notAfter fields, locale-independently
+    try:
+        return datetime.fromtimestamp(ssl.cert_time_to_seconds(not_after_str),
+                                      tz=timezone.utc)
+    except ValueError:
+        pass
+
+    # Flexible fallback: look for patterns like "Dec 31 2023" or "31 Dec 2023"
+    date_match = _DATE_FALLBACK_RE.search(not_after_str)
+    if date_match:
+        month_str, day_str, year_str = date_match.groups()
+        if month_str in _MONTH_MAP:
+            return datetime(int(year_str), _MONTH_MAP[month_str], int(day_str),
+                            tzinfo=timezone.utc)
+
+    return None
+
+
+def build_expiry_info(expiry_date: datetime, now: datetime, warning_days: int) -> Dict[str, object]:
+    """Build the expiry-info dict shared by all certificate parse paths"""
+    days_until_expiry = (expiry_date - now).days
+    return {
+        'expiry_date': expiry_date,
+        'days_until_expiry': days_until_expiry,
+        'is_expired': days_until_expiry < 0,
+        'is_expiring_soon': days_until_expiry <= warning_days
+    }